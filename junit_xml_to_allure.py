@@ -18,30 +18,104 @@ python3 junit_xml_to_allure.py --input xml/myTest.xml --output allure-results --
 cutor
 allure generate allure-results --clean -o allure-report
 allure open allure-report
-Tested with Python 3.8+ and plain ElementTree (no external deps).
+Tested with Python 3.8+ and the standard library only (no external deps).
+Parses with lxml when it is installed, otherwise straight from expat callbacks
+(no Element objects), and encodes with orjson instead of json when it is installed.
 
 """
 
 import argparse
+import functools
 import json
 import os
 import re
+import sys
 import time
 import uuid
 import hashlib
-import xml.etree.ElementTree as ET
+import itertools
+import collections
+import xml.parsers.expat
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Callable, Dict, Iterator, List, Tuple, Optional, Union
+
+try:
+    from lxml import etree as ET
+    HAVE_LXML = True
+except ImportError:  # pragma: no cover - depends on the environment
+    ET = None
+    HAVE_LXML = False
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
 
 # ----------------------------- Helpers -----------------------------
 
+def iterparse_events(xml_path: Union[str, Path]):
+    """Iterate lxml (event, element) "start"/"end" pairs, with options tuned for large JUnit files."""
+    return ET.iterparse(str(xml_path), events=("start", "end"), huge_tree=True, collect_ids=False)
+
+def local_name(tag: str) -> str:
+    """Tag without its namespace: "{urn:x}testcase" (lxml) or "urn:x}testcase" (expat) -> "testcase"."""
+    return tag.rpartition("}")[2] if "}" in tag else tag
+
+def element_text(elem: "ET._Element") -> str:
+    """Text of elem up to its first child element, with comments/PIs skipped (same as expat data)."""
+    text = elem.text or ""
+    for child in elem:
+        if isinstance(child.tag, str):
+            break
+        text += child.tail or ""
+    return text
+
+WRITE_WORKERS = 8  # threads writing result files while parsing continues
+WRITE_BATCH = 32  # files handed to a writer thread per task (a suite's last batch goes when it closes)
+MAX_PENDING = 2 * WRITE_WORKERS  # batches queued or being written before the parser waits
+
+def _dumps(obj) -> bytes:
+    """Encode obj as compact UTF-8 JSON, with orjson when available (Allure parses results, nobody reads them)."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            pass  # e.g. integers beyond 64 bits (time="1e20"), which json still encodes
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+def _dumps_pretty(obj) -> bytes:
+    """Encode obj as indented UTF-8 JSON, for files meant to be read by humans."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+def _dumps_with_labels(obj: Dict, labels_prefix: bytes, labels: List[Dict[str,str]]) -> bytes:
+    """
+    Encode obj with a trailing "labels" array made of labels_prefix and the given labels.
+    labels_prefix is a pre-encoded array body (no brackets), so shared labels are encoded once.
+    """
+    items = [labels_prefix] if labels_prefix else []
+    if labels:
+        items.append(_dumps(labels)[1:-1])
+    return _dumps(obj)[:-1] + b',"labels":[' + b",".join(items) + b"]}"
+
+def _dumps_with_children(container: Dict, children: bytearray) -> bytes:
+    """Encode container with a trailing "children" array built from comma-terminated, pre-encoded ids."""
+    return _dumps(container)[:-1] + b',"children":[' + children[:-1] + b"]}"
+
 def ms_now() -> int:
-    return int(time.time() * 1000)
+    return time.time_ns() // 1_000_000
 
+@functools.lru_cache(maxsize=16384)
 def stable_hash(s: str) -> str:
-    """Return a stable short-ish hexadecimal hash for historyId."""
-    return hashlib.md5(s.encode("utf-8")).hexdigest()
+    """Return a stable short-ish hexadecimal hash for historyId (BLAKE2b-128, 32 hex chars)."""
+    return hashlib.blake2b(s.encode("utf-8"), digest_size=16).hexdigest()
 
+@functools.lru_cache(maxsize=4096)
 def split_classname(classname: str) -> Tuple[str, str]:
     """Split fully-qualified classname into (package, class)."""
     if not classname:
@@ -58,47 +132,64 @@ def derive_suite_labels(ts_name: str, sep: str, default_parent: str) -> List[Dic
       name="Web / Checkout / Cart" with sep=" / " => parentSuite=Web, suite=Checkout, subSuite=Cart
       name="Checkout" => parentSuite=default_parent, suite=Checkout
     """
-    labels = []
+    return [{"name": n, "value": v} for n, v in _derive_suite_labels_tuple(ts_name, sep, default_parent)]
+
+@functools.lru_cache(maxsize=4096)
+def _derive_suite_labels_tuple(ts_name: str, sep: str, default_parent: str) -> Tuple[Tuple[str,str], ...]:
+    """Cached (name, value) pairs behind derive_suite_labels."""
     parts = [p.strip() for p in ts_name.split(sep)] if ts_name else []
     if len(parts) >= 3:
-        labels.append({"name":"parentSuite","value":parts[0]})
-        labels.append({"name":"suite","value":parts[1]})
-        labels.append({"name":"subSuite","value":sep.join(parts[2:])})
-    elif len(parts) == 2:
-        labels.append({"name":"parentSuite","value":parts[0]})
-        labels.append({"name":"suite","value":parts[1]})
-    elif len(parts) == 1 and parts[0]:
-        labels.append({"name":"parentSuite","value":default_parent})
-        labels.append({"name":"suite","value":parts[0]})
+        return (("parentSuite", parts[0]), ("suite", parts[1]), ("subSuite", sep.join(parts[2:])))
+    if len(parts) == 2:
+        return (("parentSuite", parts[0]), ("suite", parts[1]))
+    if len(parts) == 1 and parts[0]:
+        return (("parentSuite", default_parent), ("suite", parts[0]))
     # If empty, skip; Allure will still show Packages tree.
-    return labels
+    return ()
 
-def map_status(tc_elem: ET.Element) -> Tuple[str, Dict[str,str]]:
+def testcase_status(failure, error, skipped) -> Tuple[str, Dict[str,str]]:
     """
-    Inspect <failure>, <error>, <skipped> to compute Allure status and statusDetails.
+    Compute Allure status and statusDetails from the first <failure>, <error>, <skipped> of a testcase.
+    Each is None or an (attributes, text) pair.
     Prefers 'failed' over 'broken' for <failure>; uses 'broken' for <error>.
     """
-    failure = tc_elem.find("failure")
-    error = tc_elem.find("error")
-    skipped = tc_elem.find("skipped")
-    details = {}
     if failure is not None:
-        msg = (failure.get("message") or "").strip()
-        text = (failure.text or "").strip()
-        details = {"message": msg, "trace": text}
-        return "failed", details
+        attrs, text = failure
+        msg = (attrs.get("message") or "").strip()
+        return "failed", {"message": msg, "trace": (text or "").strip()}
     if error is not None:
-        msg = (error.get("message") or "").strip()
-        text = (error.text or "").strip()
-        details = {"message": msg, "trace": text}
-        return "broken", details  # 'error' -> 'broken' in Allure semantics
+        attrs, text = error
+        msg = (attrs.get("message") or "").strip()
+        return "broken", {"message": msg, "trace": (text or "").strip()}  # 'error' -> 'broken' in Allure semantics
     if skipped is not None:
-        msg = (skipped.get("message") or skipped.get("type") or "").strip()
-        text = (skipped.text or "").strip()
-        details = {"message": msg, "trace": text}
-        return "skipped", details
+        attrs, text = skipped
+        msg = (attrs.get("message") or attrs.get("type") or "").strip()
+        return "skipped", {"message": msg, "trace": (text or "").strip()}
     return "passed", {}
 
+def scan_testcase(tc_elem: "ET._Element") -> Tuple[str, Dict[str,str], Dict[str,str]]:
+    """
+    Walk the children of a <testcase> once to get its Allure status, statusDetails and properties.
+    Inspects <failure>, <error>, <skipped> (first of each) and the first <properties>.
+    """
+    failure = error = skipped = props_elem = None
+    for child in tc_elem:
+        t = child.tag
+        if not isinstance(t, str):
+            continue  # comment or processing instruction
+        t = local_name(t)
+        if t == "failure":
+            if failure is None: failure = (child.attrib, element_text(child))
+        elif t == "error":
+            if error is None: error = (child.attrib, element_text(child))
+        elif t == "skipped":
+            if skipped is None: skipped = (child.attrib, element_text(child))
+        elif t == "properties":
+            if props_elem is None: props_elem = child
+    props = read_properties(props_elem) if props_elem is not None else {}
+    status, details = testcase_status(failure, error, skipped)
+    return status, details, props
+
 def to_ms(seconds_str: Optional[str]) -> Optional[int]:
     try:
         if seconds_str is None:
@@ -107,13 +198,13 @@ def to_ms(seconds_str: Optional[str]) -> Optional[int]:
     except Exception:
         return None
 
-def testcase_timing(tc: ET.Element, suite_start_ms: int) -> Tuple[int, int]:
+def testcase_timing(attrib: Dict[str,str], suite_start_ms: int) -> Tuple[int, int]:
     """
     Derive start/stop for a testcase.
     If <testcase time="s"> exists, add to suite_start for stop.
     Otherwise, set short duration of 1ms.
     """
-    duration = to_ms(tc.get("time"))
+    duration = to_ms(attrib.get("time"))
     if duration is None:
         start = suite_start_ms
         stop = max(start + 1, start)  # ensure > 0 duration
@@ -122,15 +213,16 @@ def testcase_timing(tc: ET.Element, suite_start_ms: int) -> Tuple[int, int]:
         stop = start + duration
     return start, stop
 
-def collect_properties(tc: ET.Element) -> Dict[str,str]:
+def add_property(props: Dict[str,str], name: Optional[str], value: Optional[str]) -> None:
+    if name:
+        # Property names repeat across testcases; share one str object per name
+        props[sys.intern(name)] = value or ""
+
+def read_properties(props_elem: "ET._Element") -> Dict[str,str]:
     props = {}
-    props_elem = tc.find("properties")
-    if props_elem is not None:
-        for p in props_elem.findall("property"):
-            name = p.get("name")
-            value = p.get("value")
-            if name:
-                props[name] = value or ""
+    for p in props_elem:
+        if isinstance(p.tag, str) and local_name(p.tag) == "property":
+            add_property(props, p.get("name"), p.get("value"))
     return props
 
 def map_properties_to_labels_links_params(props: Dict[str,str]) -> Tuple[List[Dict[str,str]], List[Dict[str,str]], List[Dict[str,str]]]:
@@ -142,124 +234,323 @@ def map_properties_to_labels_links_params(props: Dict[str,str]) -> Tuple[List[Di
     This lets you drive epic/feature/story/etc. from plain JUnit XML.
     """
     labels, links, params = [], [], []
+    targets = {"label": labels, "link": links, "param": params}
     for k, v in props.items():
-        if k.startswith("allure.label."):
-            labels.append({"name": k[len("allure.label.") :], "value": v})
-        elif k.startswith("allure.link."):
-            links.append({"name": k[len("allure.link.") :], "url": v})
-        elif k.startswith("allure.param."):
-            params.append({"name": k[len("allure.param.") :], "value": v})
+        if not k.startswith("allure."):
+            continue
+        parts = k.split(".", 2)
+        if len(parts) < 3:
+            continue
+        _, kind, rest = parts
+        target = targets.get(kind)
+        if target is None:
+            continue
+        target.append({"name": rest, "url": v} if kind == "link" else {"name": rest, "value": v})
     return labels, links, params
 
 # ----------------------------- Core conversion -----------------------------
 
-def convert_file(xml_path: Path, out_dir: Path, suite_sep: str, default_parent: str, framework_name: str) -> None:
-    tree = ET.parse(xml_path)
-    root = tree.getroot()
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
 
-    # Normalize possible top-level <testsuite> vs <testsuites>
-    suites = []
-    if root.tag == "testsuite":
-        suites = [root]
-    elif root.tag == "testsuites":
-        suites = list(root.findall("testsuite"))
-    else:
-        # Try to be resilient (some producers wrap differently)
-        suites = list(root.findall(".//testsuite"))
+def _write_encoded(path: str, encode: Callable[..., bytes], *args) -> None:
+    # Raw os.open/os.write: result files are small, the buffered file object stack is pure overhead
+    data = memoryview(encode(*args))
+    fd = os.open(path, _WRITE_FLAGS, 0o666)  # the umask decides the final mode, as with open()
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
+def _write_batch(batch: List[Tuple[str, Callable[..., bytes], tuple]]) -> None:
+    for path, encode, args in batch:
+        _write_encoded(path, encode, *args)
 
-    for ts in suites:
-        ts_name = ts.get("name") or xml_path.stem
-        suite_uuid = str(uuid.uuid4())
-        suite_start = ms_now()
+class ResultWriter:
+    """
+    write(path, encode, *args) stores encode(*args) at path, from a thread pool while parsing continues.
+    At most MAX_PENDING batches are in flight: when the parser outruns the disk it waits
+    on the oldest batch instead of queueing every result in memory.
+    """
 
-        container = {
-            "uuid": suite_uuid,
+    def __init__(self, executor: ThreadPoolExecutor):
+        self._executor = executor
+        self._pending = collections.deque()
+        self._batch = []
+
+    def __call__(self, path: str, encode: Callable[..., bytes], *args) -> None:
+        self._batch.append((path, encode, args))
+        if len(self._batch) >= WRITE_BATCH:
+            self.flush()
+
+    def flush(self) -> None:
+        """Hand the current partial batch to the pool."""
+        if self._batch:
+            self._pending.append(self._executor.submit(_write_batch, self._batch))
+            self._batch = []
+        # .result() re-raises write errors; finished futures are dropped right away
+        while len(self._pending) > MAX_PENDING:
+            self._pending.popleft().result()
+        while self._pending and self._pending[0].done():
+            self._pending.popleft().result()
+
+    def drain(self) -> None:
+        """Write everything queued so far and wait for it."""
+        self.flush()
+        while self._pending:
+            self._pending.popleft().result()
+
+def open_suite(ts_name: str, suite_start: int, suite_sep: str, default_parent: str, framework_name: str) -> Dict:
+    """Start a <testsuite> at suite_start (ms): allocate its container and the labels shared by its testcases."""
+    suite = {
+        "container": {
+            "uuid": str(uuid.uuid4()),
             "name": ts_name,
-            "children": [],
             "befores": [],
             "afters": [],
             "links": [],
             "start": suite_start,
             "stop": suite_start,  # will be updated as we add tests
-        }
-
+        },
+        # "children" of the container: '"<uuid>",' per testcase, spliced in by the encoder
+        "children_buf": bytearray(),
         # derive common suite labels
-        suite_labels = derive_suite_labels(ts_name, suite_sep, default_parent)
-
-        # Optional: suite-level properties -> labels/links/params (rare in JUnit XML)
-        suite_props = {}
-        sp = ts.find("properties")
-        if sp is not None:
-            for p in sp.findall("property"):
-                name = p.get("name"); value = p.get("value") or ""
-                if name: suite_props[name] = value
-        sp_labels, sp_links, _ = map_properties_to_labels_links_params(suite_props)
-
-        last_stop = suite_start
-        for tc in ts.findall("testcase"):
-            classname = tc.get("classname") or ""
-            name = tc.get("name") or "test"
-            pkg, cls = split_classname(classname)
-            method = name
-
-            status, statusDetails = map_status(tc)
-            start, stop = testcase_timing(tc, last_stop or suite_start)
-            last_stop = stop
-
-            # Params from <properties> under <testcase>
-            props = collect_properties(tc)
-            p_labels, p_links, params = map_properties_to_labels_links_params(props)
-
-            # Allure required-ish fields
-            tr_uuid = str(uuid.uuid4())
-            full_name = ".".join([x for x in [pkg, cls, method] if x])
-            history_id = stable_hash(full_name or (classname + "::" + name))
-
-            labels = [
-                {"name":"framework","value":framework_name},
-                {"name":"language","value":"unknown"},
-            ]
-
-            # Package hierarchy
-            if pkg: labels.append({"name":"package","value":pkg})
-            if cls: labels.append({"name":"testClass","value":cls})
-            if method: labels.append({"name":"testMethod","value":method})
-
-            # Suite hierarchy
-            labels.extend(suite_labels)
-
-            # Optional suite/test labels from properties
-            labels.extend(sp_labels)
-            labels.extend(p_labels)
-
-            result = {
-                "uuid": tr_uuid,
-                "historyId": history_id,
-                "name": method,
-                "fullName": full_name or method,
-                "status": status,
-                "statusDetails": statusDetails,
-                "stage": "finished",
-                "steps": [],
-                "attachments": [],
-                "parameters": params,
-                "labels": labels,
-                "links": sp_links + p_links,
-                "start": start,
-                "stop": stop,
-            }
-
-            # Write test-result.json
-            with open(out_dir / f"{tr_uuid}-result.json", "w", encoding="utf-8") as f:
-                json.dump(result, f, ensure_ascii=False, indent=2)
-
-            # Add to container
-            container["children"].append(tr_uuid)
-            container["stop"] = max(container["stop"], stop)
-
-        # Write test-container.json
-        with open(out_dir / f"{suite_uuid}-container.json", "w", encoding="utf-8") as f:
-            json.dump(container, f, ensure_ascii=False, indent=2)
+        "suite_labels": derive_suite_labels(ts_name, suite_sep, default_parent),
+        "framework_name": framework_name,
+        "sp_labels": [],
+        "sp_links": [],
+        "props_seen": False,
+        "last_stop": suite_start,
+    }
+    update_base_labels(suite)
+    return suite
+
+def update_base_labels(suite: Dict) -> None:
+    """(Re)build the label prefix every testcase of the suite starts with."""
+    base_labels = [
+        {"name":"framework","value":suite["framework_name"]},
+        {"name":"language","value":"unknown"},
+        # Suite hierarchy
+        *suite["suite_labels"],
+        # Optional suite labels from properties
+        *suite["sp_labels"],
+    ]
+    # Encoded once per suite and spliced into every result file
+    suite["base_labels_json"] = _dumps(base_labels)[1:-1]
+
+def apply_suite_properties(suite: Dict, suite_props: Dict[str,str], out_prefix: str, write: "ResultWriter") -> None:
+    # Optional: suite-level properties -> labels/links/params (rare in JUnit XML)
+    if suite["props_seen"]:
+        return  # only the first <properties> of a suite counts
+    suite["props_seen"] = True
+    suite["sp_labels"], suite["sp_links"], _ = map_properties_to_labels_links_params(suite_props)
+    update_base_labels(suite)
+    if suite["children_buf"] and (suite["sp_labels"] or suite["sp_links"]):
+        # <properties> after some <testcase>s: add them to the results already written
+        write.drain()
+        label_pos = 2 + len(suite["suite_labels"])  # after framework/language/suite labels
+        for tr_uuid in suite["children_buf"][:-1].decode("ascii").replace('"', "").split(","):
+            path = out_prefix + tr_uuid + "-result.json"
+            with open(path, "rb") as f:
+                result = json.loads(f.read())
+            result["labels"][label_pos:label_pos] = suite["sp_labels"]
+            result["links"] = suite["sp_links"] + result["links"]
+            _write_encoded(path, _dumps, result)
+
+def convert_testcase(attrib: Dict[str,str], status: str, statusDetails: Dict[str,str], props: Dict[str,str],
+                     suite: Dict, out_prefix: str, write: ResultWriter) -> None:
+    """Write the result of one testcase from its attribute mapping (Element.attrib or expat attrs)."""
+    container = suite["container"]
+    classname = sys.intern(attrib.get("classname") or "")
+    name = attrib.get("name") or "test"
+    pkg, cls = split_classname(classname)
+    method = name
+
+    start, stop = testcase_timing(attrib, suite["last_stop"] or container["start"])
+    suite["last_stop"] = stop
+
+    # Params from <properties> under <testcase> (most testcases have none)
+    if props:
+        p_labels, p_links, params = map_properties_to_labels_links_params(props)
+    else:
+        p_labels, p_links, params = [], [], []
+
+    # Allure required-ish fields
+    tr_uuid = str(uuid.uuid4())
+    full_name = ".".join([x for x in [pkg, cls, method] if x])
+    history_id = stable_hash(full_name or (classname + "::" + name))
+
+    # Package hierarchy
+    pkg_cls_method_labels = []
+    if pkg: pkg_cls_method_labels.append({"name":"package","value":pkg})
+    if cls: pkg_cls_method_labels.append({"name":"testClass","value":cls})
+    if method: pkg_cls_method_labels.append({"name":"testMethod","value":method})
+
+    # Optional test labels from properties; the shared framework/suite prefix is pre-encoded
+    labels = pkg_cls_method_labels + p_labels
+
+    result = {
+        "uuid": tr_uuid,
+        "historyId": history_id,
+        "name": method,
+        "fullName": full_name or method,
+        "status": status,
+        "statusDetails": statusDetails,
+        "stage": "finished",
+        "steps": [],
+        "attachments": [],
+        "parameters": params,
+        "links": suite["sp_links"] + p_links,
+        "start": start,
+        "stop": stop,
+    }
+
+    # Write test-result.json ("labels" is appended by the encoder)
+    write(out_prefix + tr_uuid + "-result.json", _dumps_with_labels, result, suite["base_labels_json"], labels)
+
+    # Add to container
+    suite["children_buf"] += b'"' + tr_uuid.encode() + b'",'
+    container["stop"] = max(container["stop"], stop)
+
+def close_suite(suite: Dict, out_prefix: str, write: ResultWriter) -> None:
+    container = suite["container"]
+    # Write test-container.json
+    write(out_prefix + container["uuid"] + "-container.json", _dumps_with_children, container, suite["children_buf"])
+
+def push_suite(suites: List[Dict], clock: int, ts_name: str, suite_sep: str, default_parent: str,
+               framework_name: str) -> None:
+    """Open a suite right after the testcases seen so far (its parent's, or the file clock at top level)."""
+    suite_start = suites[-1]["last_stop"] if suites else clock
+    suites.append(open_suite(sys.intern(ts_name), suite_start, suite_sep, default_parent, framework_name))
+
+def pop_suite(suites: List[Dict], clock: int, out_prefix: str, write: ResultWriter) -> int:
+    """Close the innermost suite and return the file clock, advanced past it at top level."""
+    suite = suites.pop()
+    close_suite(suite, out_prefix, write)
+    write.flush()
+    suite_stop = suite["container"]["stop"]
+    if suites:
+        suites[-1]["last_stop"] = max(suites[-1]["last_stop"], suite_stop)
+        return clock
+    return max(clock, suite_stop)
+
+def free_element(elem: "ET._Element") -> None:
+    """Drop an already converted element and its earlier siblings from the tree."""
+    elem.clear()
+    parent = elem.getparent()
+    if parent is None:
+        return  # the root: its "siblings" are top-level comments/PIs, which cannot be deleted
+    while elem.getprevious() is not None:
+        del parent[0]
+
+def convert_file(xml_path: Union[str, Path], out_dir: Path, suite_sep: str, default_parent: str, framework_name: str) -> None:
+    """
+    Stream <testsuite>/<testcase> elements from xml_path and write their Allure results.
+    Every <testsuite> is converted wherever it sits (root, under <testsuites>, or nested);
+    testcases are freed once parsed and their files are written by threads in batches.
+    """
+    stem = Path(xml_path).stem
+    out_prefix = os.fspath(out_dir) + os.sep
+    # Read the clock once; suites and testcases are laid out one after another from here
+    base_ms = ms_now()
+    with ThreadPoolExecutor(max_workers=WRITE_WORKERS) as executor:
+        write = ResultWriter(executor)
+        convert_events = _convert_events if HAVE_LXML else _convert_expat
+        convert_events(xml_path, stem, out_prefix, base_ms, suite_sep, default_parent, framework_name, write)
+        write.drain()
+
+def _convert_events(xml_path: Union[str, Path], stem: str, out_prefix: str, base_ms: int, suite_sep: str,
+                    default_parent: str, framework_name: str, write: ResultWriter) -> None:
+    clock = base_ms  # stop time of the last closed top-level suite
+    suites = []  # open <testsuite> states, innermost last
+    open_tags = []  # tags of the currently open elements
+    for event, elem in iterparse_events(xml_path):
+        tag = local_name(elem.tag)
+        if event == "start":
+            open_tags.append(tag)
+            if tag == "testsuite":
+                push_suite(suites, clock, elem.get("name") or stem, suite_sep, default_parent, framework_name)
+            continue
+
+        open_tags.pop()
+        in_suite = bool(suites) and bool(open_tags) and open_tags[-1] == "testsuite"
+        if tag == "testcase":
+            if in_suite:
+                status, statusDetails, props = scan_testcase(elem)
+                convert_testcase(elem.attrib, status, statusDetails, props, suites[-1], out_prefix, write)
+            free_element(elem)
+        elif tag == "properties" and in_suite:
+            apply_suite_properties(suites[-1], read_properties(elem), out_prefix, write)
+        elif tag == "testsuite":
+            clock = pop_suite(suites, clock, out_prefix, write)
+            free_element(elem)
+
+def _convert_expat(xml_path: Union[str, Path], stem: str, out_prefix: str, base_ms: int, suite_sep: str,
+                   default_parent: str, framework_name: str, write: ResultWriter) -> None:
+    """
+    Same conversion as _convert_events, driven by raw expat callbacks so no Element objects are built.
+    Only testsuite/testcase/property attributes and failure/error/skipped text are kept.
+    """
+    suites = []  # open <testsuite> states, innermost last
+    open_tags = []  # tags of the currently open elements
+    clock = base_ms
+    tc = None  # open <testcase>: its attributes, first failure/error/skipped and properties
+    props = None  # dict collecting the <property> children of the open <properties>
+    text = None  # text chunks of the open failure/error/skipped, up to its first child (like .text)
+    parser = xml.parsers.expat.ParserCreate(namespace_separator="}")  # tags compared on local names
+
+    def start(tag, attrs):
+        nonlocal tc, props, text
+        tag = local_name(tag)
+        parent = open_tags[-1] if open_tags else None
+        open_tags.append(tag)
+        if text is not None:
+            text = parser.CharacterDataHandler = None
+        if tag == "testsuite":
+            push_suite(suites, clock, attrs.get("name") or stem, suite_sep, default_parent, framework_name)
+        elif tag == "testcase":
+            if parent == "testsuite" and suites:
+                tc = {"attrs": attrs, "failure": None, "error": None, "skipped": None, "props": None}
+        elif tc is not None and parent == "testcase":
+            if tag in ("failure", "error", "skipped"):
+                if tc[tag] is None:
+                    text = []
+                    tc[tag] = (attrs, text)
+                    parser.CharacterDataHandler = text.append
+            elif tag == "properties" and tc["props"] is None:
+                props = tc["props"] = {}
+        elif tag == "properties":
+            if parent == "testsuite" and suites:
+                props = {}
+        elif tag == "property" and parent == "properties" and props is not None:
+            add_property(props, attrs.get("name"), attrs.get("value"))
+
+    def end(tag):
+        nonlocal tc, props, text, clock
+        tag = local_name(tag)
+        open_tags.pop()
+        parent = open_tags[-1] if open_tags else None
+        if text is not None:
+            text = parser.CharacterDataHandler = None
+        if tag == "testcase":
+            if tc is not None and parent == "testsuite":
+                found = [None if tc[k] is None else (tc[k][0], "".join(tc[k][1]))
+                         for k in ("failure", "error", "skipped")]
+                status, statusDetails = testcase_status(*found)
+                convert_testcase(tc["attrs"], status, statusDetails, tc["props"] or {}, suites[-1], out_prefix, write)
+                tc = None
+        elif tag == "properties":
+            if props is not None and parent == "testsuite" and tc is None:
+                apply_suite_properties(suites[-1], props, out_prefix, write)
+            props = None
+        elif tag == "testsuite":
+            clock = pop_suite(suites, clock, out_prefix, write)
+
+    parser.buffer_text = True
+    parser.StartElementHandler = start
+    parser.EndElementHandler = end
+    with open(xml_path, "rb") as f:
+        parser.ParseFile(f)
 
 def write_executor(out_dir: Path, name: str = "XML Converter", type_: str = "other") -> None:
     executor = {
@@ -269,13 +560,34 @@ def write_executor(out_dir: Path, name: str = "XML Converter", type_: str = "oth
         "buildUrl": "",
         "reportUrl": "",
     }
-    with open(out_dir / "executor.json", "w", encoding="utf-8") as f:
-        json.dump(executor, f, ensure_ascii=False, indent=2)
+    with open(out_dir / "executor.json", "wb") as f:
+        f.write(_dumps_pretty(executor))
 
-def find_xml_files(input_path: Path) -> List[Path]:
-    if input_path.is_file() and input_path.suffix.lower() == ".xml":
-        return [input_path]
-    return sorted(input_path.rglob("*.xml"))
+def find_xml_files(input_path: Path) -> Iterator[str]:
+    """
+    Yield .xml file paths lazily so conversion can start while the tree is still being walked.
+    Each directory is listed once with os.scandir and visited in sorted order.
+    """
+    if input_path.is_file():
+        if input_path.suffix.lower() == ".xml":
+            yield str(input_path)
+        return
+    if not input_path.is_dir():
+        return
+    stack = [os.fspath(input_path)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except (PermissionError, FileNotFoundError):
+            continue  # unreadable or vanished directory: skip it, like rglob did
+        subdirs = []
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            elif entry.name.endswith(".xml") and entry.is_file():
+                yield entry.path
+        stack.extend(reversed(subdirs))
 
 def main():
     ap = argparse.ArgumentParser(description="Convert JUnit XML to Allure results JSON.")
@@ -292,12 +604,24 @@ def main():
     out_dir.mkdir(parents=True, exist_ok=True)
 
     files = find_xml_files(in_path)
-    if not files:
+    first = next(files, None)
+    if first is None:
         print("No XML files found.", file=sys.stderr)
         sys.exit(2)
 
-    for p in files:
-        convert_file(p, out_dir, suite_sep=args.suite_split, default_parent=args.default_parent, framework_name=args.framework_name)
+    convert = functools.partial(convert_file, out_dir=out_dir, suite_sep=args.suite_split,
+                                default_parent=args.default_parent, framework_name=args.framework_name)
+    # Peek up to one file per CPU: a shorter list means the walk is done and caps the workers
+    head = [first] + list(itertools.islice(files, (os.cpu_count() or 1) - 1))
+    workers = len(head)
+    if workers <= 1:
+        for p in itertools.chain(head, files):
+            convert(p)
+    else:
+        # Files are independent: convert them in parallel processes while the walk continues.
+        # Each file is a big unit of work, so hand them out one at a time.
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            list(ex.map(convert, itertools.chain(head, files), chunksize=1))
 
     if args.write_executor:
         write_executor(out_dir)
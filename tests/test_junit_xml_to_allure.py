@@ -0,0 +1,134 @@
+import json
+import os
+import stat
+from pathlib import Path
+
+import pytest
+
+import junit_xml_to_allure as conv
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures"
+FIXTURES = sorted(FIXTURE_DIR.glob("*.xml"))
+
+
+def convert(xml_path: Path, out_dir: Path, monkeypatch, use_lxml: bool) -> Path:
+    monkeypatch.setattr(conv, "HAVE_LXML", use_lxml)
+    out_dir.mkdir()
+    conv.convert_file(xml_path, out_dir, suite_sep=" / ", default_parent="Tests", framework_name="junit-xml")
+    return out_dir
+
+
+def normalized(out_dir: Path):
+    """Results and containers without the run-specific ids and timestamps."""
+    results, containers, names = [], [], {}
+    for f in out_dir.glob("*-result.json"):
+        r = json.loads(f.read_bytes())
+        names[r["uuid"]] = r["fullName"]
+        r["duration"] = r["stop"] - r["start"]
+        for k in ("uuid", "start", "stop"):
+            del r[k]
+        results.append(r)
+    for f in out_dir.glob("*-container.json"):
+        c = json.loads(f.read_bytes())
+        c["duration"] = c["stop"] - c["start"]
+        c["children"] = sorted(names[u] for u in c["children"])
+        for k in ("uuid", "start", "stop"):
+            del c[k]
+        containers.append(c)
+    key = lambda d: json.dumps(d, sort_keys=True)
+    return sorted(results, key=key), sorted(containers, key=key)
+
+
+def results_by_name(out_dir: Path):
+    return {r["fullName"]: r for r in normalized(out_dir)[0]}
+
+
+@pytest.mark.parametrize("xml_path", FIXTURES, ids=lambda p: p.stem)
+def test_lxml_and_expat_agree(xml_path, tmp_path, monkeypatch):
+    pytest.importorskip("lxml")
+    via_lxml = convert(xml_path, tmp_path / "lxml", monkeypatch, use_lxml=True)
+    via_expat = convert(xml_path, tmp_path / "expat", monkeypatch, use_lxml=False)
+    assert normalized(via_lxml) == normalized(via_expat)
+
+
+@pytest.mark.parametrize("use_lxml", [False, True], ids=["expat", "lxml"])
+def test_status_and_labels(use_lxml, tmp_path, monkeypatch):
+    if use_lxml:
+        pytest.importorskip("lxml")
+    results = results_by_name(convert(FIXTURE_DIR / "suites.xml", tmp_path / "out", monkeypatch, use_lxml))
+    removes = results["com.acme.CartTest.removes"]
+    assert removes["status"] == "failed"
+    assert removes["statusDetails"] == {"message": "boom ü", "trace": "assert 1 == 2"}
+    assert removes["duration"] == 1250
+    assert {"name": "epic", "value": "Shop"} in removes["labels"]
+    assert removes["links"] == [{"name": "DOC", "url": "http://doc"}]
+    assert results["Plain.skip"]["parameters"] == [{"name": "browser", "value": "ff"}]
+    # <failure> wins over an earlier <error>
+    assert results["x.y.both"]["status"] == "failed"
+
+
+@pytest.mark.parametrize("use_lxml", [False, True], ids=["expat", "lxml"])
+def test_namespaced_file_and_comments_in_text(use_lxml, tmp_path, monkeypatch):
+    if use_lxml:
+        pytest.importorskip("lxml")
+    results = results_by_name(convert(FIXTURE_DIR / "namespaced.xml", tmp_path / "out", monkeypatch, use_lxml))
+    assert results["a.B.c"]["statusDetails"]["trace"] == "abc"
+    assert {"name": "epic", "value": "E"} in results["a.B.c"]["labels"]
+    assert results["s"]["status"] == "skipped"
+
+
+@pytest.mark.parametrize("use_lxml", [False, True], ids=["expat", "lxml"])
+def test_late_suite_properties_apply_to_every_testcase(use_lxml, tmp_path, monkeypatch):
+    if use_lxml:
+        pytest.importorskip("lxml")
+    results = results_by_name(convert(FIXTURE_DIR / "late_properties.xml", tmp_path / "out", monkeypatch, use_lxml))
+    assert set(results) == {"a.B.one", "two", "three"}
+    for r in results.values():
+        assert {"name": "epic", "value": "E"} in r["labels"]
+        assert {"name": "epic", "value": "IGNORED"} not in r["labels"]
+        assert r["links"] == [{"name": "D", "url": "u"}]
+
+
+def test_time_beyond_64_bits_is_still_encoded(tmp_path, monkeypatch):
+    results = results_by_name(convert(FIXTURE_DIR / "huge_time.xml", tmp_path / "out", monkeypatch, use_lxml=False))
+    assert results["a.B.slow"]["duration"] == int(1e20 * 1000.0)
+    assert results["ok"]["duration"] == 1000
+
+
+def test_find_xml_files_skips_unreadable_directories(tmp_path, monkeypatch):
+    (tmp_path / "a.xml").write_text("<testsuite/>")
+    (tmp_path / "locked").mkdir()
+    (tmp_path / "locked" / "b.xml").write_text("<testsuite/>")
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "c.xml").write_text("<testsuite/>")
+    real_scandir = conv.os.scandir
+
+    def scandir(path):
+        if path.endswith("locked"):
+            raise PermissionError(13, "Permission denied", path)
+        return real_scandir(path)
+
+    monkeypatch.setattr(conv.os, "scandir", scandir)
+    found = [Path(p).relative_to(tmp_path).as_posix() for p in conv.find_xml_files(tmp_path)]
+    assert found == ["a.xml", "sub/c.xml"]
+
+
+@pytest.mark.parametrize("use_lxml", [False, True], ids=["expat", "lxml"])
+def test_root_testsuite_after_comment_and_pi(use_lxml, tmp_path, monkeypatch):
+    if use_lxml:
+        pytest.importorskip("lxml")
+    out_dir = convert(FIXTURE_DIR / "root_after_comment.xml", tmp_path / "out", monkeypatch, use_lxml)
+    results = results_by_name(out_dir)
+    assert set(results) == {"a.B.one", "two"}
+    assert results["two"]["status"] == "failed"
+    assert [c["name"] for c in normalized(out_dir)[1]] == ["Root"]
+
+
+def test_result_files_follow_the_umask(tmp_path, monkeypatch):
+    old = os.umask(0o002)
+    try:
+        out_dir = convert(FIXTURE_DIR / "suites.xml", tmp_path / "out", monkeypatch, use_lxml=False)
+    finally:
+        os.umask(old)
+    modes = {stat.S_IMODE(f.stat().st_mode) for f in out_dir.iterdir()}
+    assert modes == {0o664}